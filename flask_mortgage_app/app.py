@@ -12,11 +12,15 @@ Features:
 - Formal PDF report export (/pdf) with the FULL amortization schedule
 """
 
-from flask import Flask, render_template, request, send_file
+from flask import Flask, Response, render_template, request
+from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 import io
 import math
 
+import orjson
+
 
 from calculator import (
     calculate_amortization,
@@ -24,6 +28,8 @@ from calculator import (
     calculate_rent_vs_buy,
     calculate_refi,
     apply_resale_impact,
+    pmi_schedule,
+    schedule_rows,
     tax_savings_monthly
 )
 
@@ -85,130 +91,182 @@ def parse_bool(val) -> bool:
     return str(val).lower() in ("1", "true", "on", "yes", "y")
 
 
-@app.route("/results", methods=["POST"])
-def results():
-    """Compute results and return the partial `_results.html` for HTMX swap."""
+@dataclass(frozen=True)
+class MortgageInputs:
+    """All scenario inputs from the dashboard form (hashable, so results can be cached)."""
+    price: float
+    down_pct: float
+    rate: float
+    years: int
+    start_date: date
+    pmi_rate: float
+    pmi_exempt: bool
+    resale_enable: bool
+    maintenance: tuple  # ((bucket, annual amount), ...)
+    taxes_monthly: float
+    insurance_monthly: float
+    hoa_monthly: float
+    rent: float
+    rent_growth: float
+    resale_value: float
+    resale_date: date
+    selling_cost_pct: float
+    tax_deduction: bool
+    tax_rate: float
+    refi_enable: bool
+    refi_rate: float
+    refi_years: int
+    refi_closing: float
+    refi_start_date: date | None = None
+
+    def __post_init__(self):
+        # Accept a plain dict for maintenance and default the refi start to the loan start
+        if isinstance(self.maintenance, dict):
+            object.__setattr__(self, "maintenance", tuple(self.maintenance.items()))
+        if self.refi_start_date is None:
+            object.__setattr__(self, "refi_start_date", self.start_date)
+
+    @property
+    def down_payment(self) -> float:
+        return (self.down_pct / 100.0) * self.price
+
+    @property
+    def principal(self) -> float:
+        return max(self.price - self.down_payment, 0.0)
+
+    @property
+    def maintenance_dict(self) -> dict:
+        return dict(self.maintenance)
+
+    @property
+    def maint_monthly(self) -> float:
+        return sum(v for _, v in self.maintenance) / 12.0
+
+
+def parse_inputs(form) -> MortgageInputs:
+    """Parse the dashboard form (shared by /results and /pdf)."""
     # --- Core inputs
-    price = float(request.form.get("price", 0))
-    down_pct = float(request.form.get("down_pct", 0))
-    down_payment = (down_pct / 100.0) * price
-    principal = max(price - down_payment, 0.0)
-    rate = float(request.form.get("rate", 0))
-    years = int(request.form.get("years", 30))
-    start_date = datetime.strptime(request.form.get("start_date"), "%Y-%m-%d").date()
-
-    # --- PMI Inputs ---
-    pmi_rate = float(request.form.get("pmi_rate", 0) or 0)  # annual % of loan
-    pmi_exempt = str(request.form.get("pmi_exempt", "")).lower() in ("1","true","on","yes","y")
-
-    # PMI & resale toggles
-    pmi_rate = float(request.form.get("pmi_rate", 0) or 0)
-    pmi_exempt = str(request.form.get("pmi_exempt", "")).lower() in ("1","true","on","yes","y")
-    resale_enable = str(request.form.get("resale_enable", "")).lower() in ("1","true","on","yes","y")
+    price = float(form.get("price", 0))
+    down_pct = float(form.get("down_pct", 0))
+    rate = float(form.get("rate", 0))
+    years = int(form.get("years", 30))
+    start_date = datetime.strptime(form.get("start_date"), "%Y-%m-%d").date()
+
+    # --- PMI & resale toggles
+    pmi_rate = float(form.get("pmi_rate", 0) or 0)  # annual % of loan
+    pmi_exempt = parse_bool(form.get("pmi_exempt", ""))
+    resale_enable = parse_bool(form.get("resale_enable", ""))
 
     # --- Maintenance (annual buckets → monthly in calculations)
     maintenance = {
-        "roof": float(request.form.get("maint_roof", 0) or 0),
-        "hvac": float(request.form.get("maint_hvac", 0) or 0),
-        "plumbing": float(request.form.get("maint_plumbing", 0) or 0),
-        "appliances": float(request.form.get("maint_appliances", 0) or 0),
-        "lawn": float(request.form.get("maint_lawn", 0) or 0),
-        "upgrades": float(request.form.get("maint_upgrades", 0) or 0),
-        "other": float(request.form.get("maint_other", 0) or 0),
+        "roof": float(form.get("maint_roof", 0) or 0),
+        "hvac": float(form.get("maint_hvac", 0) or 0),
+        "plumbing": float(form.get("maint_plumbing", 0) or 0),
+        "appliances": float(form.get("maint_appliances", 0) or 0),
+        "lawn": float(form.get("maint_lawn", 0) or 0),
+        "upgrades": float(form.get("maint_upgrades", 0) or 0),
+        "other": float(form.get("maint_other", 0) or 0),
     }
-    maint_monthly = sum(maintenance.values()) / 12.0
-
-    # --- Other monthly costs
-    taxes_monthly = float(request.form.get("taxes_monthly", 0) or 0)
-    insurance_monthly = float(request.form.get("insurance_monthly", 0) or 0)
-    hoa_monthly = float(request.form.get("hoa_monthly", 0) or 0)
 
-    # --- Rent assumptions
-    rent = float(request.form.get("rent", 0) or 0)
-    rent_growth = float(request.form.get("rent_growth", 0) or 0)
-
-    # --- Resale assumptions
-    resale_value = float(request.form.get("resale_value", 0) or 0)
-    resale_date = datetime.strptime(request.form.get("resale_date"), "%Y-%m-%d").date()
-    selling_cost_pct = float(request.form.get("selling_cost_pct", 6) or 6)
+    # --- Refi inputs (optional)
+    refi_start_date_str = form.get("refi_start_date")
 
-    # --- Taxes (optional)
-    tax_deduction = parse_bool(request.form.get("tax_deduction"))
-    tax_rate = float(request.form.get("tax_rate", 0) or 0)
+    return MortgageInputs(
+        price=price,
+        down_pct=down_pct,
+        rate=rate,
+        years=years,
+        start_date=start_date,
+        pmi_rate=pmi_rate,
+        pmi_exempt=pmi_exempt,
+        resale_enable=resale_enable,
+        maintenance=maintenance,
+        # --- Other monthly costs
+        taxes_monthly=float(form.get("taxes_monthly", 0) or 0),
+        insurance_monthly=float(form.get("insurance_monthly", 0) or 0),
+        hoa_monthly=float(form.get("hoa_monthly", 0) or 0),
+        # --- Rent assumptions
+        rent=float(form.get("rent", 0) or 0),
+        rent_growth=float(form.get("rent_growth", 0) or 0),
+        # --- Resale assumptions
+        resale_value=float(form.get("resale_value", 0) or 0),
+        resale_date=datetime.strptime(form.get("resale_date"), "%Y-%m-%d").date(),
+        selling_cost_pct=float(form.get("selling_cost_pct", 6) or 6),
+        # --- Taxes (optional)
+        tax_deduction=parse_bool(form.get("tax_deduction")),
+        tax_rate=float(form.get("tax_rate", 0) or 0),
+        refi_enable=parse_bool(form.get("refi_enable")),
+        refi_rate=float(form.get("refi_rate", 0) or 0),
+        refi_years=int(form.get("refi_years", years) or years),
+        refi_closing=float(form.get("refi_closing", 0) or 0),
+        refi_start_date=datetime.strptime(refi_start_date_str, "%Y-%m-%d").date() if refi_start_date_str else None,
+    )
 
-    # --- Display scope for amortization table
-    scope = int(request.form.get("amort_scope", 12))
 
-    # --- Refi inputs (optional)
-    refi_enable = parse_bool(request.form.get("refi_enable"))
-    refi_rate = float(request.form.get("refi_rate", 0) or 0)
-    refi_years = int(request.form.get("refi_years", years) or years)
-    refi_closing = float(request.form.get("refi_closing", 0) or 0)
-    refi_start_date_str = request.form.get("refi_start_date")
-    refi_start_date = datetime.strptime(refi_start_date_str, "%Y-%m-%d").date() if refi_start_date_str else start_date
+@lru_cache(maxsize=64)
+def compute_all(inputs: MortgageInputs) -> dict:
+    """
+    Run every calculation for one scenario.
 
-    # --- derived helpers ---
-    maint_monthly = sum(maintenance.values()) / 12.0
+    Memoized on the frozen inputs, so paging through /results or exporting the same
+    scenario via /pdf reuses the computed series. Treat the returned values as read-only.
+    """
+    principal = inputs.principal
+    maint_monthly = inputs.maint_monthly
 
     # --- Calculations
-    amort = calculate_amortization(principal, rate, years, start_date)
-    monthly_pi = calculate_monthly_payment(principal, rate, years)
-    tax_sav = tax_savings_monthly(amort, tax_rate, taxes_monthly, tax_deduction)
+    monthly_pi = calculate_monthly_payment(principal, inputs.rate, inputs.years)
+    amort = calculate_amortization(principal, inputs.rate, inputs.years, inputs.start_date)
+    tax_sav = tax_savings_monthly(amort, inputs.tax_rate, inputs.taxes_monthly, inputs.tax_deduction)
 
     # PMI schedule aligned to amortization
-    from calculator import pmi_schedule  # top-level import also fine if you prefer
     pmi_list = pmi_schedule(
         amortization=amort,
-        home_price=price,
-        pmi_rate_annual_pct=pmi_rate,
-        enabled=(down_pct < 20.0),   # auto-enable if DP < 20
-        exempt=pmi_exempt,
+        home_price=inputs.price,
+        pmi_rate_annual_pct=inputs.pmi_rate,
+        enabled=(inputs.down_pct < 20.0),   # auto-enable if DP < 20
+        exempt=inputs.pmi_exempt,
         stop_at_ltv80=True
     )
 
+    rent_buy_inputs = {
+        "rent": inputs.rent,
+        "rent_growth": inputs.rent_growth,
+        "maint_monthly": maint_monthly,
+        "taxes_monthly": inputs.taxes_monthly,
+        "insurance_monthly": inputs.insurance_monthly,
+        "hoa_monthly": inputs.hoa_monthly,
+    }
+
     # --- Rent vs Buy (full term, no equity subtraction) ---
     # --- ALWAYS build the FULL rent vs buy series first ---
     rent_buy_full = calculate_rent_vs_buy(
-        {
-            "rent": rent,
-            "rent_growth": rent_growth,
-            "maint_monthly": maint_monthly,
-            "taxes_monthly": taxes_monthly,
-            "insurance_monthly": insurance_monthly,
-            "hoa_monthly": hoa_monthly,
-        },
+        rent_buy_inputs,
         amort,
-        tax_sav_monthly=tax_sav if tax_deduction else None,
+        tax_sav_monthly=tax_sav if inputs.tax_deduction else None,
         pmi_monthly=pmi_list,
     )
 
+    # Resale impact is always reported in the PDF; the dashboard gates it on resale_enable
+    resale = apply_resale_impact(amort, inputs.resale_value, inputs.resale_date, inputs.selling_cost_pct)
+
     # Default: when resale disabled, use the full series as the working series
     rent_buy = rent_buy_full
-    resale = None
-    sale_idx = len(amort) - 1
 
     # --- Optional resale path (truncate + equity adjustment) ---
-    if resale_enable:
-        resale = apply_resale_impact(amort, resale_value, resale_date, selling_cost_pct)
+    if inputs.resale_enable:
         sale_idx = resale["sale_index"]
 
-        rent_buy_trunc = calculate_rent_vs_buy(
-            {
-                "rent": rent,
-                "rent_growth": rent_growth,
-                "maint_monthly": maint_monthly,
-                "taxes_monthly": taxes_monthly,
-                "insurance_monthly": insurance_monthly,
-                "hoa_monthly": hoa_monthly,
-            },
-            amort[: sale_idx + 1],
-            tax_sav_monthly=(tax_sav[: sale_idx + 1] if tax_deduction else None),
-            pmi_monthly=pmi_list[: sale_idx + 1],
-        )
+        # The truncated series is a prefix of the full one; list slices are copies,
+        # so the equity adjustment below leaves rent_buy_full untouched
+        rent_buy_trunc = {
+            "rent": rent_buy_full["rent"][: sale_idx + 1],
+            "buy": rent_buy_full["buy"][: sale_idx + 1],
+        }
 
         # subtract equity at sale from the last buy point (TCO view)
         if rent_buy_trunc.get("buy"):
-            equity = float(resale.get("equity", 0.0)) if resale else 0.0
+            equity = float(resale.get("equity", 0.0))
             last = rent_buy_trunc["buy"][-1]
             rent_buy_trunc["buy"][-1] = round(max(last - equity, 0.0), 2)
 
@@ -216,24 +274,70 @@ def results():
 
     # --- metrics (include PMI in first month total) ---
     first_month_total = (
-        amort[0]["payment"]
-        + taxes_monthly + insurance_monthly + hoa_monthly
+        float(amort["payment"][0])
+        + inputs.taxes_monthly + inputs.insurance_monthly + inputs.hoa_monthly
         + maint_monthly
         + (pmi_list[0] if pmi_list else 0.0)
-        - (tax_sav[0] if (tax_deduction and tax_sav) else 0.0)
+        - (float(tax_sav[0]) if (inputs.tax_deduction and len(tax_sav)) else 0.0)
     )
     metrics = {
         "monthly_pi": round(monthly_pi, 2),
         "first_month_total": round(first_month_total, 2),
-        "total_interest": amort[-1]["cumulative_interest"],
+        "total_interest": float(amort["cumulative_interest"][-1]),
     }
 
-    # Amortization table size
+    # Refi compare
+    refi_info = None
+    if inputs.refi_enable:
+        refi_info = calculate_refi(
+            current_full_sched=amort,
+            refi_rate=inputs.refi_rate,
+            refi_years=inputs.refi_years,
+            refi_start_date=inputs.refi_start_date,
+            closing_costs=inputs.refi_closing
+        )
+
+    # Chart.js payload, serialized once per scenario (orjson handles the NumPy arrays directly)
+    charts_json = orjson.dumps(
+        {
+            "payment": {
+                "pi": metrics["monthly_pi"],
+                "taxes": inputs.taxes_monthly,
+                "ins": inputs.insurance_monthly,
+                "hoa": inputs.hoa_monthly,
+                "maint": round(maint_monthly, 2),
+                "pmi": pmi_list[0] if pmi_list else 0.0,
+            },
+            "rentbuy": rent_buy,
+            "rentbuyFull": rent_buy_full,
+            "cuminterest": {
+                "months": len(amort["month"]),
+                "data": amort["cumulative_interest"],
+            },
+        },
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()
+
+    return {
+        "amort": amort,
+        "tax_sav": tax_sav,
+        "pmi_list": pmi_list,
+        "rent_buy": rent_buy,
+        "rent_buy_full": rent_buy_full,
+        "resale": resale,
+        "refi_info": refi_info,
+        "metrics": metrics,
+        "charts_json": charts_json,
+    }
+
+
+def paginate(amort: dict, form) -> dict:
+    """Slice one page of the amortization table; returns the template context for it."""
     # --- Paging: page_size = rows per page (was "amort_scope"); page = current page
-    page_size_raw = request.form.get("amort_scope", "12")
+    page_size_raw = form.get("amort_scope", "12")
     page_size = 360 if str(page_size_raw).lower() in ("360", "full") else int(page_size_raw)
-    page = int(request.form.get("page", 1))
-    total_rows = len(amort)
+    page = int(form.get("page", 1))
+    total_rows = len(amort["month"])
     total_pages = max(1, math.ceil(total_rows / page_size))
 
     # Keep page in bounds
@@ -244,164 +348,106 @@ def results():
 
     start = (page - 1) * page_size
     end = min(start + page_size, total_rows)
-    amort_subset = amort[start:end]
+    return {
+        "amortization": schedule_rows(amort, start, end),
+        "page": page,
+        "total_pages": total_pages,
+        "page_size": page_size,
+        "total_rows": total_rows,
+    }
 
 
-    # Refi compare
-    refi_info = None
-    if refi_enable:
-        refi_info = calculate_refi(
-            current_full_sched=amort,
-            refi_rate=refi_rate,
-            refi_years=refi_years,
-            refi_start_date=refi_start_date,
-            closing_costs=refi_closing
-        )
+@app.route("/results", methods=["POST"])
+def results():
+    """Compute results and return the partial `_results.html` for HTMX swap."""
+    inputs = parse_inputs(request.form)
+    out = compute_all(inputs)
+    amort = out["amort"]
+    pmi_list = out["pmi_list"]
 
+    # --- Display scope for amortization table
+    scope = int(request.form.get("amort_scope", 12))
 
     return render_template(
         "_results.html",
-        price=price,
-        down_pct=down_pct,
-        down_payment=down_payment,
-        principal=principal,
-        rate=rate,
-        years=years,
-        start_date=start_date,
-        taxes_monthly=taxes_monthly,
-        insurance_monthly=insurance_monthly,
-        hoa_monthly=hoa_monthly,
-        maintenance=maintenance,
-        metrics=metrics,
-        amortization=amort_subset,
-        amort_full=amort,
-        rent_buy=rent_buy,                 # up-to-resale, equity-subtracted
-        rent_buy_full=rent_buy_full,       # FULL 360 months
-        resale_info=resale,
-        tax_savings=tax_sav,
-        tax_deduction=tax_deduction,
-        tax_rate=tax_rate,
-        refi_info=refi_info,
+        price=inputs.price,
+        down_pct=inputs.down_pct,
+        down_payment=inputs.down_payment,
+        principal=inputs.principal,
+        rate=inputs.rate,
+        years=inputs.years,
+        start_date=inputs.start_date,
+        taxes_monthly=inputs.taxes_monthly,
+        insurance_monthly=inputs.insurance_monthly,
+        hoa_monthly=inputs.hoa_monthly,
+        maintenance=inputs.maintenance_dict,
+        metrics=out["metrics"],
+        rent_buy=out["rent_buy"],            # up-to-resale, equity-subtracted
+        rent_buy_full=out["rent_buy_full"],  # FULL 360 months
+        resale_info=out["resale"] if inputs.resale_enable else None,
+        tax_savings=out["tax_sav"],
+        tax_deduction=inputs.tax_deduction,
+        tax_rate=inputs.tax_rate,
+        refi_info=out["refi_info"],
         amort_scope=scope,
-        page=page,
-        total_pages=total_pages,
-        page_size=page_size,
-        total_rows=total_rows,
-        refi_start_date=refi_start_date,
-        pmi_rate=pmi_rate,
-        pmi_exempt=pmi_exempt,
+        refi_start_date=inputs.refi_start_date,
+        pmi_rate=inputs.pmi_rate,
+        pmi_exempt=inputs.pmi_exempt,
         pmi_first_month=pmi_list[0] if pmi_list else 0.0,
-        resale_enable=resale_enable,
+        resale_enable=inputs.resale_enable,
         pmi_list=pmi_list,
+        charts_json=out["charts_json"],
+        **paginate(amort, request.form),
     )
+
+
+@app.route("/amortization", methods=["POST"])
+def amortization():
+    """Return just the amortization table partial for pager clicks (scenario comes from the cache)."""
+    out = compute_all(parse_inputs(request.form))
+    return render_template("_amortization.html", **paginate(out["amort"], request.form))
     
 
 @app.route("/pdf", methods=["POST"])
 def pdf():
     """Generate and return a formal PDF report (inline view)."""
-    # Parse (same as /results, condensed where possible)
-    price = float(request.form.get("price", 0))
-    down_pct = float(request.form.get("down_pct", 0))
-    down_payment = (down_pct / 100.0) * price
-    principal = max(price - down_payment, 0.0)
-    rate = float(request.form.get("rate", 0))
-    years = int(request.form.get("years", 30))
-    start_date = datetime.strptime(request.form.get("start_date"), "%Y-%m-%d").date()
-    refi_start_date_str = request.form.get("refi_start_date")
-    refi_start_date = datetime.strptime(refi_start_date_str, "%Y-%m-%d").date() if refi_start_date_str else start_date
-
-
-    taxes_monthly = float(request.form.get("taxes_monthly", 0) or 0)
-    insurance_monthly = float(request.form.get("insurance_monthly", 0) or 0)
-    hoa_monthly = float(request.form.get("hoa_monthly", 0) or 0)
-
-    maintenance = {
-        "roof": float(request.form.get("maint_roof", 0) or 0),
-        "hvac": float(request.form.get("maint_hvac", 0) or 0),
-        "plumbing": float(request.form.get("maint_plumbing", 0) or 0),
-        "appliances": float(request.form.get("maint_appliances", 0) or 0),
-        "lawn": float(request.form.get("maint_lawn", 0) or 0),
-        "upgrades": float(request.form.get("maint_upgrades", 0) or 0),
-        "other": float(request.form.get("maint_other", 0) or 0),
-    }
-    maint_monthly = sum(maintenance.values()) / 12.0
-
-    rent = float(request.form.get("rent", 0) or 0)
-    rent_growth = float(request.form.get("rent_growth", 0) or 0)
-
-    resale_value = float(request.form.get("resale_value", 0) or 0)
-    resale_date = datetime.strptime(request.form.get("resale_date"), "%Y-%m-%d").date()
-    selling_cost_pct = float(request.form.get("selling_cost_pct", 6) or 6)
-
-    tax_deduction = parse_bool(request.form.get("tax_deduction"))
-    tax_rate = float(request.form.get("tax_rate", 0) or 0)
-
-    refi_enable = parse_bool(request.form.get("refi_enable"))
-    refi_rate = float(request.form.get("refi_rate", 0) or 0)
-    refi_years = int(request.form.get("refi_years", years) or years)
-    refi_closing = float(request.form.get("refi_closing", 0) or 0)
+    # Same parsing as /results; the computation is usually already cached from it
+    inputs = parse_inputs(request.form)
+    out = compute_all(inputs)
+    tax_sav = out["tax_sav"]
+
+    report_inputs = {
+        "price": inputs.price,
+        "down_pct": inputs.down_pct,
+        "down_payment": inputs.down_payment,
+        "principal": inputs.principal,
+        "rate": inputs.rate,
+        "years": inputs.years,
+        "start_date_str": inputs.start_date.strftime("%b %Y"),
+        "taxes_monthly": inputs.taxes_monthly,
+        "insurance_monthly": inputs.insurance_monthly,
+        "hoa_monthly": inputs.hoa_monthly,
+        "maintenance": inputs.maintenance_dict,
+        "refi_start_date": inputs.refi_start_date,
 
-    # Compute
-    amort = calculate_amortization(principal, rate, years, start_date)
-    monthly_pi = calculate_monthly_payment(principal, rate, years)
-    tax_sav = tax_savings_monthly(amort, tax_rate, taxes_monthly, tax_deduction)
-    resale = apply_resale_impact(amort, resale_value, resale_date, selling_cost_pct)
-
-
-    metrics = {
-        "monthly_pi": round(monthly_pi, 2),
-        "first_month_total": round(
-            amort[0]["payment"]
-            + taxes_monthly
-            + insurance_monthly
-            + hoa_monthly
-            + maint_monthly
-            - (tax_sav[0] if tax_sav else 0),
-            2,
-        ),
-        "total_interest": amort[-1]["cumulative_interest"],
     }
 
-    refi_info = None
-    if refi_enable:
-        refi_info = calculate_refi(
-            current_full_sched=amort,
-            refi_rate=refi_rate,
-            refi_years=refi_years,
-            refi_start_date=refi_start_date,
-            closing_costs=refi_closing
-        )
-
-
-    inputs = {
-        "price": price,
-        "down_pct": down_pct,
-        "down_payment": down_payment,
-        "principal": principal,
-        "rate": rate,
-        "years": years,
-        "start_date_str": start_date.strftime("%b %Y"),
-        "taxes_monthly": taxes_monthly,
-        "insurance_monthly": insurance_monthly,
-        "hoa_monthly": hoa_monthly,
-        "maintenance": maintenance,
-        "refi_start_date": refi_start_date,
-
-    }
-
-    # Build PDF to memory and stream inline
+    # Build PDF to memory and return the bytes directly (no send_file re-read)
     buf = io.BytesIO()
     generate_pdf(
         buf,
-        inputs,
-        metrics,
-        amort,
-        resale_info=resale,
-        refi_info=refi_info,
-        tax_savings=None if not tax_deduction else [sum(tax_sav[:12])],
+        report_inputs,
+        out["metrics"],
+        out["amort"],
+        resale_info=out["resale"],
+        refi_info=out["refi_info"],
+        tax_savings=None if not inputs.tax_deduction else [float(tax_sav[:12].sum())],
+    )
+    return Response(
+        buf.getvalue(),
+        mimetype="application/pdf",
+        headers={"Content-Disposition": 'inline; filename="mortgage_report.pdf"'},
     )
-    buf.seek(0)
-    return send_file(buf, mimetype="application/pdf", as_attachment=False, download_name="mortgage_report.pdf")
 
 
 if __name__ == "__main__":
@@ -9,7 +9,24 @@ Core financial calculations for the Mortgage Dashboard:
 - Resale impact / equity at sale
 """
 
+from collections.abc import Mapping
 from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to the closed-form NumPy path
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 
 def add_months(d: date, n: int) -> date:
@@ -34,6 +51,18 @@ def add_months(d: date, n: int) -> date:
     return date(y, m, day)
 
 
+def month_dates(d: date, n: int) -> np.ndarray:
+    """
+    Vectorized add_months: dates d + 0..n-1 months as a datetime64[D] array,
+    clamping the day to end-of-month like `add_months`.
+    """
+    first = np.datetime64(date(d.year, d.month, 1), "M") + np.arange(n)
+    days_in_month = (first + 1).astype("datetime64[D]") - first.astype("datetime64[D]")
+    day = np.minimum(d.day, days_in_month.astype(np.int64))
+    return first.astype("datetime64[D]") + (day - 1)
+
+
+@lru_cache(maxsize=1024)
 def calculate_monthly_payment(principal: float, annual_rate: float, years: int) -> float:
     """Standard fixed-rate mortgage payment (P&I only)."""
     r = (annual_rate / 100.0) / 12.0
@@ -43,68 +72,151 @@ def calculate_monthly_payment(principal: float, annual_rate: float, years: int)
     return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
 
 
+@njit(cache=True)
+def _amort_core(principal, r, n, payment):
+    """
+    Month-by-month schedule of an `n`-month loan.
+    Values are carried at full precision and rounded to cents once at the end;
+    cumulative interest is a single cumsum over the unrounded monthly interest.
+
+    Returns (interest, principal_paid, payment_eff, balance, cumulative_interest) arrays,
+    shorter than `n` only if the loan is paid off early.
+    """
+    interest = np.empty(n)
+    principal_paid = np.empty(n)
+    payment_eff = np.empty(n)
+    balance = np.empty(n)
+
+    bal = principal
+    k = 0
+    while k < n:
+        it = bal * r
+        pp = payment - it
+        pe = payment
+
+        # Last payment clears the remaining balance (no negative/leftover balance from rounding)
+        if pp > bal - 1e-6 or k == n - 1:
+            pp = bal
+            pe = it + pp
+
+        bal -= pp
+
+        interest[k] = it
+        principal_paid[k] = pp
+        payment_eff[k] = pe
+        balance[k] = max(bal, 0.0)
+        k += 1
+        if bal <= 0.0:
+            break
+    return (
+        np.round(interest[:k], 2),
+        np.round(principal_paid[:k], 2),
+        np.round(payment_eff[:k], 2),
+        np.round(balance[:k], 2),
+        np.round(np.cumsum(interest[:k]), 2),
+    )
+
+
+def _amort_closed_form(principal, r, n, payment):
+    """
+    Same outputs as `_amort_core`, computed from the closed-form balance
+    B_i = P*(1+r)^i - pmt*((1+r)^i - 1)/r and rounded once at the end.
+    """
+    i = np.arange(1, n + 1)
+    if r == 0:
+        balance = principal - payment * i
+    else:
+        growth = (1.0 + r) ** i
+        balance = principal * growth - payment * (growth - 1.0) / r
+
+    # Stop at the first month the (rounded-up) payment pays the loan off, as the loop does
+    paid_off = np.flatnonzero(balance < 1e-6)
+    if len(paid_off):
+        balance = balance[: paid_off[0] + 1]
+    m = len(balance)
+
+    interest = np.empty(m)
+    principal_paid = np.empty(m)
+    payment_eff = np.full(m, payment)
+    if m:
+        interest[0] = principal * r
+        interest[1:] = balance[:-1] * r
+        principal_paid[:] = payment - interest
+
+        # Last payment clears whatever balance is left after rounding
+        prev_balance = balance[-2] if m > 1 else principal
+        principal_paid[-1] = prev_balance
+        payment_eff[-1] = interest[-1] + prev_balance
+        balance[-1] = 0.0
+
+    return (
+        np.round(interest, 2),
+        np.round(principal_paid, 2),
+        np.round(payment_eff, 2),
+        np.round(np.maximum(balance, 0.0), 2),
+        np.round(np.cumsum(interest), 2),
+    )
+
+
+@lru_cache(maxsize=128)
 def calculate_amortization(principal: float, annual_rate: float, years: int, start_date: date):
     """
     Produce full amortization schedule.
 
-    Each row dict contains:
-      month, date, interest, principal, payment, pi, cumulative_interest, balance
+    Runs the cent-rounded monthly loop under numba when it is installed, otherwise
+    the vectorized closed form.
+
+    Returns a columnar schedule: a read-only mapping of equal-length NumPy arrays keyed by
+      month, date (datetime64[D]), interest, principal, payment, pi, cumulative_interest, balance
+    Use `schedule_rows` to get per-month row dicts for display.
+
+    Results are memoized per argument tuple and shared between callers, so both the
+    mapping (a MappingProxyType) and its arrays are read-only.
     """
     payment = round(calculate_monthly_payment(principal, annual_rate, years), 2)
     r = (annual_rate / 100.0) / 12.0
-    n = years * 12
-    balance = principal
-    cumulative_interest = 0.0
-    schedule = []
-
-    for i in range(1, n + 1):
-        interest = round(balance * r, 2)
-        principal_paid = round(payment - interest, 2)
-
-        # Adjust last payment to avoid negative balance from rounding
-        if principal_paid > balance:
-            principal_paid = round(balance, 2)
-            payment_eff = round(interest + principal_paid, 2)
-        else:
-            payment_eff = payment
-
-        balance = round(balance - principal_paid, 2)
-        cumulative_interest = round(cumulative_interest + interest, 2)
-        pay_date = add_months(start_date, i - 1)
-
-        schedule.append(
-            {
-                "month": i,
-                "date": pay_date,
-                "interest": interest,
-                "principal": principal_paid,
-                "payment": payment_eff,
-                "pi": payment_eff,  # alias for P&I for clarity in templates
-                "cumulative_interest": cumulative_interest,
-                "balance": max(balance, 0.0),
-            }
-        )
-        if balance <= 0.0:
-            break
-    return schedule
+    n = max(years * 12, 0)
+
+    core = _amort_core if HAS_NUMBA else _amort_closed_form
+    interest, principal_paid, payment_eff, balance, cumulative_interest = core(float(principal), r, n, payment)
+    months = len(interest)
+    schedule = {
+        "month": np.arange(1, months + 1),
+        "date": month_dates(start_date, months),
+        "interest": interest,
+        "principal": principal_paid,
+        "payment": payment_eff,
+        "pi": payment_eff,  # alias for P&I for clarity in templates
+        "cumulative_interest": cumulative_interest,
+        "balance": balance,
+    }
+    for col in schedule.values():
+        col.setflags(write=False)
+    return MappingProxyType(schedule)
+
+
+def schedule_rows(schedule: Mapping, start: int = 0, end: int | None = None) -> list:
+    """Materialize rows [start:end) of a columnar schedule as plain dicts (templates, PDF)."""
+    cols = {k: v[start:end].tolist() for k, v in schedule.items()}
+    return [dict(zip(cols, vals)) for vals in zip(*cols.values())]
 
 
-def tax_savings_monthly(amortization: list, tax_rate_pct: float, property_tax_monthly: float, enabled: bool) -> list:
+def tax_savings_monthly(amortization: Mapping, tax_rate_pct: float, property_tax_monthly: float, enabled: bool) -> np.ndarray:
     """
     Approximate monthly tax savings = (interest_this_month + property_tax_monthly) * tax_rate.
 
-    Returns a list aligned to amortization length. If disabled or tax_rate <= 0, returns zeros.
+    Returns an array aligned to amortization length. If disabled or tax_rate <= 0, returns zeros.
     """
+    interest = amortization["interest"]
     if not enabled or tax_rate_pct <= 0:
-        return [0.0 for _ in amortization]
-    t = tax_rate_pct / 100.0
-    return [round((row["interest"] + property_tax_monthly) * t, 2) for row in amortization]
+        return np.zeros(len(interest))
+    return np.round((interest + property_tax_monthly) * (tax_rate_pct / 100.0), 2)
 
 
 def calculate_rent_vs_buy(
     inputs: dict,
-    amortization: list,
-    tax_sav_monthly: list | None = None,
+    amortization: Mapping,
+    tax_sav_monthly: np.ndarray | None = None,
     pmi_monthly: list | None = None,
 ):
     """
@@ -115,8 +227,8 @@ def calculate_rent_vs_buy(
       rent_growth: annual % growth (e.g., 3 for 3%)
       maint_monthly, taxes_monthly, insurance_monthly, hoa_monthly
 
-    tax_sav_monthly: optional list (len == amortization) of monthly tax savings to subtract
-    pmi_monthly: optional list (len == amortization) of PMI to add while active
+    tax_sav_monthly: optional array (len == amortization) of monthly tax savings to subtract
+    pmi_monthly: optional list (len == amortization) of PMI to add while active; None if no PMI
     """
     rent = float(inputs.get("rent", 0.0))
     rent_growth = float(inputs.get("rent_growth", 0.0)) / 100.0
@@ -125,37 +237,27 @@ def calculate_rent_vs_buy(
     insurance = float(inputs.get("insurance_monthly", 0.0))
     hoa = float(inputs.get("hoa_monthly", 0.0))
 
-    rent_costs, buy_costs = [], []
-    cum_rent, cum_buy = 0.0, 0.0
+    payment = amortization["payment"]
+    n = len(payment)
+    years_idx = np.arange(n) // 12
 
-    for i, row in enumerate(amortization, start=1):
-        # Rent grows annually
-        if i > 1 and (i - 1) % 12 == 0:
-            rent *= (1.0 + rent_growth)
+    # Rent grows annually
+    rent_vec = rent * (1.0 + rent_growth) ** years_idx
 
-        # Cumulative rent
-        cum_rent += rent
-        rent_costs.append(round(cum_rent, 2))
-
-        # Ownership outflow this month
-        monthly_cost = row["payment"] + taxes + insurance + hoa + maint
-
-        # Add PMI if provided
-        if pmi_monthly:
-            monthly_cost += float(pmi_monthly[i - 1])
-
-        # Subtract tax savings if provided
-        if tax_sav_monthly:
-            monthly_cost -= float(tax_sav_monthly[i - 1])
-
-        cum_buy += monthly_cost
-        buy_costs.append(round(cum_buy, 2))
-
-    return {"rent": rent_costs, "buy": buy_costs}
+    # Ownership outflow each month, plus PMI / minus tax savings if provided
+    buy_vec = payment + (taxes + insurance + hoa + maint)
+    if pmi_monthly is not None:
+        buy_vec = buy_vec + np.asarray(pmi_monthly, dtype=float)
+    if tax_sav_monthly is not None:
+        buy_vec = buy_vec - np.asarray(tax_sav_monthly, dtype=float)
 
+    return {
+        "rent": np.round(np.cumsum(rent_vec), 2).tolist(),
+        "buy": np.round(np.cumsum(buy_vec), 2).tolist(),
+    }
 
 
-def calculate_refi(current_full_sched: list, refi_rate: float, refi_years: int, refi_start_date: date, closing_costs: float):
+def calculate_refi(current_full_sched: Mapping, refi_rate: float, refi_years: int, refi_start_date: date, closing_costs: float):
     """
     Compare continuing the CURRENT loan vs REFINANCING, starting from `refi_start_date`.
 
@@ -169,23 +271,21 @@ def calculate_refi(current_full_sched: list, refi_rate: float, refi_years: int,
     Returns:
       dict: { current_interest, refi_interest, difference, conclusion, remaining_balance, refi_start_index }
     """
-    if not current_full_sched:
+    n = len(current_full_sched["month"])
+    if not n:
         return {"current_interest": 0.0, "refi_interest": 0.0, "difference": 0.0, "conclusion": "—"}
 
     # 1) find index for refi start
-    idx = len(current_full_sched) - 1
-    for i, row in enumerate(current_full_sched):
-        if row["date"] >= refi_start_date:
-            idx = i
-            break
+    idx = min(int(np.searchsorted(current_full_sched["date"], np.datetime64(refi_start_date), side="left")), n - 1)
 
     # Interest already paid up to the month BEFORE idx
-    prev_cum_int = current_full_sched[idx - 1]["cumulative_interest"] if idx > 0 else 0.0
-    final_cum_int = current_full_sched[-1]["cumulative_interest"]
+    cum_int = current_full_sched["cumulative_interest"]
+    prev_cum_int = float(cum_int[idx - 1]) if idx > 0 else 0.0
+    final_cum_int = float(cum_int[-1])
     current_remaining_interest = round(final_cum_int - prev_cum_int, 2)
 
     # Remaining balance right before refi start month
-    remaining_balance = current_full_sched[idx - 1]["balance"] if idx > 0 else current_full_sched[0]["balance"]
+    remaining_balance = float(current_full_sched["balance"][max(idx - 1, 0)])
 
     # 4) Build refi schedule from that balance
     refi_sched = calculate_amortization(
@@ -194,7 +294,8 @@ def calculate_refi(current_full_sched: list, refi_rate: float, refi_years: int,
         years=refi_years,
         start_date=refi_start_date
     )
-    refi_interest_total = refi_sched[-1]["cumulative_interest"] + float(closing_costs)
+    refi_cum_int = refi_sched["cumulative_interest"]
+    refi_interest_total = (float(refi_cum_int[-1]) if len(refi_cum_int) else 0.0) + float(closing_costs)
 
     diff = round(current_remaining_interest - refi_interest_total, 2)
     conclusion = "✅ Refi saves money" if diff > 0 else "❌ Refi costs more"
@@ -209,19 +310,16 @@ def calculate_refi(current_full_sched: list, refi_rate: float, refi_years: int,
 
 
 
-def apply_resale_impact(amortization: list, resale_price: float, resale_date: date, selling_cost_pct: float):
+def apply_resale_impact(amortization: Mapping, resale_price: float, resale_date: date, selling_cost_pct: float):
     """
     Determine balance at (or just before) the resale_date and compute net equity:
       equity = net_proceeds(resale_price - selling_costs) - remaining_balance
 
     Returns dict with sale_index, equity and components.
     """
-    sale_idx = len(amortization) - 1
-    for i, row in enumerate(amortization):
-        if row["date"] >= resale_date:
-            sale_idx = i
-            break
-    balance = amortization[sale_idx]["balance"]
+    dates = amortization["date"]
+    sale_idx = min(int(np.searchsorted(dates, np.datetime64(resale_date), side="left")), len(dates) - 1)
+    balance = float(amortization["balance"][sale_idx])
     selling_costs = round(resale_price * (selling_cost_pct / 100.0), 2)
     net_proceeds = round(resale_price - selling_costs, 2)
     equity = round(net_proceeds - balance, 2)
@@ -234,24 +332,20 @@ def apply_resale_impact(amortization: list, resale_price: float, resale_date: da
         "equity": equity,
     }
 
-def pmi_schedule(amortization: list, home_price: float, pmi_rate_annual_pct: float,
-                 enabled: bool, exempt: bool = False, stop_at_ltv80: bool = True) -> list:
+def pmi_schedule(amortization: Mapping, home_price: float, pmi_rate_annual_pct: float,
+                 enabled: bool, exempt: bool = False, stop_at_ltv80: bool = True) -> list | None:
     """
     Simple PMI model:
-      - If not enabled or exempt or rate <= 0, all zeros
+      - If not enabled or exempt or rate <= 0, returns None (no PMI series at all)
       - Otherwise charge monthly PMI = (pmi_rate_annual_pct% * original_loan_amount)/12
       - Stop when current LTV <= 80% (balance <= 80% of home_price), if stop_at_ltv80
     """
-    if not enabled or exempt or pmi_rate_annual_pct <= 0 or not amortization:
-        return [0.0 for _ in amortization]
-
-    original_balance = amortization[0]["balance"] + amortization[0]["principal"]  # ≈ original principal
-    monthly_pmi = (pmi_rate_annual_pct / 100.0) * original_balance / 12.0
-    out = []
-    for row in amortization:
-        bal = row["balance"]
-        if stop_at_ltv80 and bal <= 0.8 * home_price:
-            out.append(0.0)
-        else:
-            out.append(round(monthly_pmi, 2))
-    return out
+    bal = amortization["balance"]
+    if not enabled or exempt or pmi_rate_annual_pct <= 0 or not len(bal):
+        return None
+
+    original_balance = float(bal[0] + amortization["principal"][0])  # ≈ original principal
+    monthly_pmi = round((pmi_rate_annual_pct / 100.0) * original_balance / 12.0, 2)
+    if not stop_at_ltv80:
+        return [monthly_pmi] * len(bal)
+    return np.where(bal <= 0.8 * home_price, 0.0, monthly_pmi).tolist()
@@ -14,13 +14,27 @@ from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 
+_money = "${:,.2f}".format
+
+# Shared, read-only style objects (built once at import instead of per report)
+_STYLES = getSampleStyleSheet()
+_GRID_STYLE = TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)])
+_AMORT_STYLE = TableStyle(
+    [
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ]
+)
+_AMORT_HEADER = ["Month", "Date", "Payment", "Principal", "Interest", "P&I", "Cumulative Interest", "Balance"]
+
 
 def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_info=None, tax_savings=None):
     """Build a multi-page landscape PDF into `buffer`."""
     doc = SimpleDocTemplate(
         buffer, pagesize=landscape(letter), leftMargin=24, rightMargin=24, topMargin=24, bottomMargin=24
     )
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     story = []
 
     # Title
@@ -41,7 +55,7 @@ def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_i
         ["HOA", f"${inputs.get('hoa_monthly', 0) * 12:,.0f}/yr"],
     ]
     t = Table(assum, hAlign="LEFT")
-    t.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)]))
+    t.setStyle(_GRID_STYLE)
     story.append(t)
     story.append(Spacer(1, 8))
 
@@ -50,7 +64,7 @@ def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_i
         story.append(Paragraph("<b>Maintenance (Annual)</b>", styles["Heading2"]))
         md = [[k.capitalize(), f"${v:,.0f}"] for k, v in inputs["maintenance"].items()]
         mt = Table(md, hAlign="LEFT")
-        mt.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)]))
+        mt.setStyle(_GRID_STYLE)
         story.append(mt)
         story.append(Spacer(1, 8))
 
@@ -64,7 +78,7 @@ def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_i
     if tax_savings and len(tax_savings) > 0:
         md.append(["Annual Tax Savings (Year 1)", f"${tax_savings[0]:,.0f}"])
     t2 = Table(md, hAlign="LEFT")
-    t2.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)]))
+    t2.setStyle(_GRID_STYLE)
     story.append(t2)
     story.append(Spacer(1, 8))
 
@@ -78,7 +92,7 @@ def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_i
             ["Conclusion", refi_info["conclusion"]],
         ]
         rt = Table(rd, hAlign="LEFT")
-        rt.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)]))
+        rt.setStyle(_GRID_STYLE)
         story.append(rt)
         story.append(Spacer(1, 8))
 
@@ -93,38 +107,24 @@ def generate_pdf(buffer, inputs, metrics, amortization, resale_info=None, refi_i
             ["Net Equity Realized", f"${resale_info['equity']:,.0f}"],
         ]
         rtab = Table(rs, hAlign="LEFT")
-        rtab.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.25, colors.grey)]))
+        rtab.setStyle(_GRID_STYLE)
         story.append(rtab)
         story.append(Spacer(1, 8))
 
     # Full amortization schedule
     story.append(PageBreak())
     story.append(Paragraph("<b>Amortization Schedule (Full)</b>", styles["Heading2"]))
-    header = ["Month", "Date", "Payment", "Principal", "Interest", "P&I", "Cumulative Interest", "Balance"]
-    rows = [header]
-    for row in amortization:
-        rows.append(
-            [
-                row["month"],
-                row["date"].strftime("%b %Y"),
-                f"${row['payment']:,.2f}",
-                f"${row['principal']:,.2f}",
-                f"${row['interest']:,.2f}",
-                f"${row['pi']:,.2f}",
-                f"${row['cumulative_interest']:,.2f}",
-                f"${row['balance']:,.2f}",
-            ]
-        )
+    # Format column-by-column from the schedule arrays, then zip into table rows
+    money_cols = ("payment", "principal", "interest", "pi", "cumulative_interest", "balance")
+    cols = [
+        amortization["month"].tolist(),
+        [d.strftime("%b %Y") for d in amortization["date"].tolist()],
+        *(list(map(_money, amortization[k].tolist())) for k in money_cols),
+    ]
+    rows = [_AMORT_HEADER]
+    rows.extend(map(list, zip(*cols)))
     at = Table(rows, repeatRows=1)
-    at.setStyle(
-        TableStyle(
-            [
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ]
-        )
-    )
+    at.setStyle(_AMORT_STYLE)
     story.append(at)
 
     doc.build(story)
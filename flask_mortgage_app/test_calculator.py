@@ -0,0 +1,44 @@
+# test_calculator.py
+"""
+Parity check between the numba amortization loop and its closed-form NumPy fallback.
+
+Without numba installed, `_amort_core` runs as plain Python, so this runs either way.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from calculator import _amort_closed_form, _amort_core, calculate_monthly_payment
+
+PRINCIPALS = [0, 1, 100, 999.99, 285000, 1_000_000]
+RATES = [0, 0.01, 3, 6.5, 9.99, 30]
+YEARS = [1, 15, 30]
+
+
+@pytest.mark.parametrize("principal,annual_rate,years", list(itertools.product(PRINCIPALS, RATES, YEARS)))
+def test_closed_form_matches_loop(principal, annual_rate, years):
+    r = (annual_rate / 100.0) / 12.0
+    n = years * 12
+    payment = round(calculate_monthly_payment(principal, annual_rate, years), 2)
+
+    loop = _amort_core(float(principal), r, n, payment)
+    closed = _amort_closed_form(float(principal), r, n, payment)
+
+    assert len(loop[0]) == len(closed[0])
+    for a, b in zip(loop, closed):
+        # Float error between the two can only flip a half-cent rounding tie
+        np.testing.assert_allclose(a, b, rtol=0, atol=0.01 + 1e-9)
+
+
+@pytest.mark.parametrize("core", [_amort_core, _amort_closed_form])
+def test_schedule_stops_at_payoff(core):
+    # 100 / 360 rounds up to 0.28, which clears the loan in month 358
+    interest, principal_paid, payment, balance, _ = core(100.0, 0.0, 360, 0.28)
+    assert len(interest) == 358
+    assert (principal_paid >= 0).all()
+    assert balance[-1] == 0.0
+
+    # A zero-principal loan is a single empty row
+    assert len(core(0.0, 0.065 / 12, 360, 0.0)[0]) == 1